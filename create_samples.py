@@ -5,80 +5,141 @@ Creates realistic test images when actual samples are not available
 """
 
 import cv2
+import math
 import numpy as np
 import os
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, Tuple
 
-def create_landscape_image(size: Tuple[int, int] = (720, 1280)) -> np.ndarray:
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy path
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_nature_pattern(image, height, width):
+        """Fused per-pixel multi-frequency pattern -> BGR kernel"""
+        for y in prange(height):
+            cy = 4 * np.pi * y / (height - 1)
+            for x in range(width):
+                cx = 4 * np.pi * x / (width - 1)
+                p = (math.sin(cx) * math.cos(cy)
+                     + 0.5 * math.sin(2 * cx + np.pi / 4) * math.cos(2 * cy + np.pi / 4)
+                     + 0.3 * math.sin(0.5 * cx) * math.cos(0.5 * cy))
+                image[y, x, 0] = min(255, max(0, 60 + int(p * 20)))
+                image[y, x, 1] = min(255, max(0, 120 + int(p * 50)))
+                image[y, x, 2] = min(255, max(0, 80 + int(p * 30)))
+
+# Shared PCG64 generator for all sample creators
+_rng = np.random.default_rng()
+
+# 1-D coefficients of the 3x3, sigma=0.5 finishing blur, computed once
+_BLUR_KERNEL = cv2.getGaussianKernel(3, 0.5).astype(np.float32)
+
+# Largest sample size; worker buffers are allocated once at this size
+_MAX_SIZE = (1080, 1920)
+_out_buf = None
+_scratch_buf = None
+
+def _image_buffer(buf: Optional[np.ndarray], height: int, width: int,
+                  dtype=np.uint8) -> np.ndarray:
+    """Return a (height, width, 3) array, carved out of buf when one is given"""
+    if buf is None:
+        return np.empty((height, width, 3), dtype=dtype)
+    return buf[:height, :width]
+
+def create_landscape_image(size: Tuple[int, int] = (720, 1280),
+                           out: Optional[np.ndarray] = None,
+                           scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """Create a synthetic landscape image with gradients and patterns"""
     height, width = size
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image = _image_buffer(out, height, width)
     
     # Sky gradient (blue to light blue)
     sky_height = height // 3
-    for y in range(sky_height):
-        intensity = int(120 + (180 - 120) * (1 - y / sky_height))
-        image[y, :] = [intensity, intensity - 30, intensity - 60]
+    y = np.arange(sky_height)
+    intensity = (120 + (180 - 120) * (1 - y / sky_height)).astype(np.int16)[:, None]
+    image[:sky_height] = np.stack([
+        np.broadcast_to(intensity, (sky_height, width)),
+        np.broadcast_to(intensity - 30, (sky_height, width)),
+        np.broadcast_to(intensity - 60, (sky_height, width)),
+    ], axis=-1).astype(np.uint8)
     
     # Mountains (dark gray/brown)
     mountain_start = sky_height
     mountain_height = height // 4
-    for y in range(mountain_start, mountain_start + mountain_height):
-        noise = np.random.randint(-20, 20, width)
-        base_color = 80 + noise
-        image[y, :] = [base_color, base_color - 10, base_color - 20]
+    noise = _rng.integers(-20, 20, (mountain_height, width), dtype=np.int16)
+    base_color = 80 + noise
+    image[mountain_start:mountain_start + mountain_height] = np.stack(
+        [base_color, base_color - 10, base_color - 20], axis=-1
+    ).clip(0, 255).astype(np.uint8)
     
     # Ground (green/brown)
     ground_start = mountain_start + mountain_height
-    for y in range(ground_start, height):
-        noise = np.random.randint(-15, 15, width)
-        green_intensity = 100 + noise
-        image[y, :] = [green_intensity - 40, green_intensity, green_intensity - 60]
+    noise = _rng.integers(-15, 15, (height - ground_start, width), dtype=np.int16)
+    green_intensity = 100 + noise
+    image[ground_start:] = np.stack(
+        [green_intensity - 40, green_intensity, green_intensity - 60], axis=-1
+    ).clip(0, 255).astype(np.uint8)
     
     # Add some texture
-    texture = np.random.randint(-10, 10, (height, width, 3))
-    image = np.clip(image.astype(np.int16) + texture, 0, 255).astype(np.uint8)
+    texture = _rng.integers(-10, 10, (height, width, 3), dtype=np.int8)
+    image = cv2.add(image, texture, dst=image, dtype=cv2.CV_8U)  # saturating add
     
     return image
 
-def create_portrait_image(size: Tuple[int, int] = (960, 720)) -> np.ndarray:
+def create_portrait_image(size: Tuple[int, int] = (960, 720),
+                          out: Optional[np.ndarray] = None,
+                          scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """Create a synthetic portrait-like image"""
     height, width = size
-    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image = _image_buffer(out, height, width)
     
-    # Background gradient
-    for y in range(height):
-        for x in range(width):
-            intensity = int(150 + 50 * np.sin(x / width * np.pi) * np.cos(y / height * np.pi))
-            image[y, x] = [intensity, intensity - 20, intensity - 40]
+    # Background gradient (outer product of the per-column and per-row terms)
+    sin_x = np.sin(np.arange(width) / width * np.pi)
+    cos_y = np.cos(np.arange(height) / height * np.pi)
+    intensity = (150 + 50 * np.outer(cos_y, sin_x)).astype(np.int16)
+    image[..., 0] = np.clip(intensity, 0, 255)
+    image[..., 1] = np.clip(intensity - 20, 0, 255)
+    image[..., 2] = np.clip(intensity - 40, 0, 255)
     
     # Add circular "face" region with different color
     center_x, center_y = width // 2, height // 2
     radius = min(width, height) // 4
     
-    y_coords, x_coords = np.ogrid[:height, :width]
-    mask = (x_coords - center_x) ** 2 + (y_coords - center_y) ** 2 <= radius ** 2
+    y0, y1 = max(0, center_y - radius), min(height, center_y + radius + 1)
+    x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+    dy = np.arange(y0, y1)[:, None] - center_y
+    dx = np.arange(x0, x1)[None, :] - center_x
+    mask = dx * dx + dy * dy <= radius ** 2
     
     # Face region (warmer tones)
-    face_color = np.random.randint(180, 220, 3)
-    image[mask] = face_color
+    face_color = _rng.integers(180, 220, 3)
+    image[y0:y1, x0:x1][mask] = face_color
     
     # Add noise for realism
-    noise = np.random.randint(-15, 15, (height, width, 3))
-    image = np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    noise = _rng.integers(-15, 15, (height, width, 3), dtype=np.int8)
+    image = cv2.add(image, noise, dst=image, dtype=cv2.CV_8U)  # saturating add
     
     return image
 
-def create_architecture_image(size: Tuple[int, int] = (800, 1200)) -> np.ndarray:
+def create_architecture_image(size: Tuple[int, int] = (800, 1200),
+                              out: Optional[np.ndarray] = None,
+                              scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """Create a synthetic architectural image with geometric patterns"""
     height, width = size
-    image = np.full((height, width, 3), 120, dtype=np.uint8)
+    image = _image_buffer(out, height, width)
+    image[...] = 120
+    
+    # Window color table: row 0 is a dark window, row 1 a lit one
+    window_palette = np.array([[40, 50, 60], [200, 220, 180]], dtype=np.uint8)
     
     # Create vertical "building" stripes
     stripe_width = width // 8
     for i in range(0, width, stripe_width * 2):
         end_x = min(i + stripe_width, width)
-        color_intensity = np.random.randint(80, 180)
+        color_intensity = _rng.integers(80, 180)
         image[:, i:end_x] = [color_intensity, color_intensity - 20, color_intensity - 30]
     
     # Add horizontal "floor" lines
@@ -87,122 +148,183 @@ def create_architecture_image(size: Tuple[int, int] = (800, 1200)) -> np.ndarray
         if y < height:
             image[y:y+3, :] = [60, 60, 60]  # Dark horizontal lines
     
-    # Add window-like rectangles
-    for building in range(0, width, stripe_width * 2):
-        for floor in range(floor_spacing, height - floor_spacing, floor_spacing):
-            window_x = building + stripe_width // 4
-            window_y = floor + floor_spacing // 4
-            window_w = stripe_width // 2
-            window_h = floor_spacing // 2
-            
-            if window_x + window_w < width and window_y + window_h < height:
-                # Random window color (some lit, some dark)
-                if np.random.random() > 0.3:
-                    window_color = [200, 220, 180]  # Lit window
-                else:
-                    window_color = [40, 50, 60]     # Dark window
-                
-                image[window_y:window_y+window_h, window_x:window_x+window_w] = window_color
+    # Add window-like rectangles (all windows share one size, so stamp
+    # them in a single fancy-indexed assignment)
+    window_w = stripe_width // 2
+    window_h = floor_spacing // 2
+    buildings = np.arange(0, width, stripe_width * 2)
+    floors = np.arange(floor_spacing, height - floor_spacing, floor_spacing)
+    bx, fy = np.meshgrid(buildings, floors, indexing='ij')
+    win_x = (bx + stripe_width // 4).ravel()
+    win_y = (fy + floor_spacing // 4).ravel()
+    inside = (win_x + window_w < width) & (win_y + window_h < height)
+    win_x, win_y = win_x[inside], win_y[inside]
+    
+    # Random window color (some lit, some dark)
+    lit = _rng.random(win_x.size) > 0.3
+    window_colors = window_palette[lit.astype(np.intp)]
+    
+    yy = win_y[:, None, None] + np.arange(window_h)[None, :, None]
+    xx = win_x[:, None, None] + np.arange(window_w)[None, None, :]
+    image[yy, xx] = window_colors[:, None, None, :]
     
     # Add texture noise
-    noise = np.random.randint(-8, 8, (height, width, 3))
-    image = np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    noise = _rng.integers(-8, 8, (height, width, 3), dtype=np.int8)
+    image = cv2.add(image, noise, dst=image, dtype=cv2.CV_8U)  # saturating add
     
     return image
 
-def create_nature_image(size: Tuple[int, int] = (1080, 1920)) -> np.ndarray:
+def create_nature_image(size: Tuple[int, int] = (1080, 1920),
+                        out: Optional[np.ndarray] = None,
+                        scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """Create a synthetic nature image with organic patterns"""
     height, width = size
-    image = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    # Create organic-looking background with multiple frequency noise
-    x = np.linspace(0, 4 * np.pi, width)
-    y = np.linspace(0, 4 * np.pi, height)
-    X, Y = np.meshgrid(x, y)
-    
-    # Multi-frequency pattern for organic look
-    pattern1 = np.sin(X) * np.cos(Y)
-    pattern2 = np.sin(2 * X + np.pi/4) * np.cos(2 * Y + np.pi/4)
-    pattern3 = np.sin(0.5 * X) * np.cos(0.5 * Y)
-    
-    combined_pattern = pattern1 + 0.5 * pattern2 + 0.3 * pattern3
+    image = _image_buffer(out, height, width)
     
-    # Convert to color (green nature theme)
-    base_green = 120
-    green_channel = base_green + (combined_pattern * 50).astype(np.int32)
-    red_channel = (base_green - 40) + (combined_pattern * 30).astype(np.int32)
-    blue_channel = (base_green - 60) + (combined_pattern * 20).astype(np.int32)
-    
-    image[:, :, 0] = np.clip(blue_channel, 0, 255)
-    image[:, :, 1] = np.clip(green_channel, 0, 255)
-    image[:, :, 2] = np.clip(red_channel, 0, 255)
+    if njit is not None:
+        # Pattern and color conversion fused into a single parallel pass
+        _fill_nature_pattern(image, height, width)
+    else:
+        # Create organic-looking background with multiple frequency noise
+        x = np.linspace(0, 4 * np.pi, width)
+        y = np.linspace(0, 4 * np.pi, height)
+        
+        # Multi-frequency pattern for organic look (each term is separable,
+        # so evaluate sin/cos on the 1-D axes and take outer products)
+        sx1, cy1 = np.sin(x), np.cos(y)
+        sx2, cy2 = np.sin(2 * x + np.pi/4), np.cos(2 * y + np.pi/4)
+        sx3, cy3 = np.sin(0.5 * x), np.cos(0.5 * y)
+        
+        combined_pattern = (np.outer(cy1, sx1)
+                            + 0.5 * np.outer(cy2, sx2)
+                            + 0.3 * np.outer(cy3, sx3))
+        
+        # Convert to color (green nature theme), interleaved directly in
+        # OpenCV's BGR order so the image is written in one contiguous pass
+        base_green = 120
+        blue_channel = (base_green - 60) + (combined_pattern * 20).astype(np.int16)
+        green_channel = base_green + (combined_pattern * 50).astype(np.int16)
+        red_channel = (base_green - 40) + (combined_pattern * 30).astype(np.int16)
+        
+        image[...] = np.clip(np.stack([blue_channel, green_channel, red_channel], axis=-1),
+                             0, 255)
     
     # Add random "leaf" or "rock" spots
+    spot_colors = np.array([
+        [80, 140, 60],   # Dark green
+        [100, 80, 70],   # Brown
+        [60, 100, 80],   # Medium green
+    ], dtype=np.uint8)
+    
     num_spots = 50
-    for _ in range(num_spots):
-        spot_x = np.random.randint(0, width - 20)
-        spot_y = np.random.randint(0, height - 20)
-        spot_size = np.random.randint(5, 25)
+    color_idxs = _rng.integers(0, len(spot_colors), num_spots)
+    ys = np.arange(height)
+    xs = np.arange(width)
+    for i in range(num_spots):
+        spot_x = _rng.integers(0, width - 20)
+        spot_y = _rng.integers(0, height - 20)
+        spot_size = _rng.integers(5, 25)
+        spot_color = spot_colors[color_idxs[i]]
         
-        spot_color = np.random.choice([
-            [80, 140, 60],   # Dark green
-            [100, 80, 70],   # Brown
-            [60, 100, 80],   # Medium green
-        ])
-        
-        # Create circular spot
-        y_coords, x_coords = np.ogrid[:height, :width]
-        mask = (x_coords - spot_x) ** 2 + (y_coords - spot_y) ** 2 <= spot_size ** 2
-        image[mask] = spot_color
+        # Create circular spot (mask only the spot's bounding box)
+        y0, y1 = max(0, spot_y - spot_size), min(height, spot_y + spot_size + 1)
+        x0, x1 = max(0, spot_x - spot_size), min(width, spot_x + spot_size + 1)
+        dy = ys[y0:y1, None] - spot_y
+        dx = xs[None, x0:x1] - spot_x
+        mask = dx * dx + dy * dy <= spot_size ** 2
+        image[y0:y1, x0:x1][mask] = spot_color
     
     return image
 
-def create_abstract_image(size: Tuple[int, int] = (600, 800)) -> np.ndarray:
+def create_abstract_image(size: Tuple[int, int] = (600, 800),
+                          out: Optional[np.ndarray] = None,
+                          scratch: Optional[np.ndarray] = None) -> np.ndarray:
     """Create a synthetic abstract image with geometric shapes"""
     height, width = size
-    image = np.random.randint(50, 200, (height, width, 3), dtype=np.uint8)
+    image = _image_buffer(out, height, width)
+    image[...] = _rng.integers(50, 200, (height, width, 3), dtype=np.uint8)
     
     # Add geometric shapes
     shapes = ['circle', 'rectangle', 'triangle']
-    colors = [
+    colors = np.array([
         [255, 100, 100],  # Red
         [100, 255, 100],  # Green
         [100, 100, 255],  # Blue
         [255, 255, 100],  # Yellow
         [255, 100, 255],  # Magenta
         [100, 255, 255],  # Cyan
-    ]
+    ], dtype=np.uint8)
     
     num_shapes = 15
-    for _ in range(num_shapes):
-        shape = np.random.choice(shapes)
-        color = np.random.choice(colors)
+    
+    # Draw every shape's parameters up front so the stamping loop below
+    # touches no RNG state
+    kinds = _rng.integers(0, len(shapes), num_shapes)
+    color_idxs = _rng.integers(0, len(colors), num_shapes)
+    center_xs = _rng.integers(0, width, num_shapes)
+    center_ys = _rng.integers(0, height, num_shapes)
+    radii = _rng.integers(20, 80, num_shapes)
+    rect_xs = _rng.integers(0, width - 50, num_shapes)
+    rect_ys = _rng.integers(0, height - 50, num_shapes)
+    rect_ws = _rng.integers(30, 100, num_shapes)
+    rect_hs = _rng.integers(30, 100, num_shapes)
+    
+    ys = np.arange(height)
+    xs = np.arange(width)
+    for i in range(num_shapes):
+        shape = shapes[kinds[i]]
+        color = colors[color_idxs[i]]
         
         if shape == 'circle':
-            center_x = np.random.randint(0, width)
-            center_y = np.random.randint(0, height)
-            radius = np.random.randint(20, 80)
+            center_x, center_y, radius = center_xs[i], center_ys[i], radii[i]
             
-            y_coords, x_coords = np.ogrid[:height, :width]
-            mask = (x_coords - center_x) ** 2 + (y_coords - center_y) ** 2 <= radius ** 2
-            image[mask] = color
+            y0, y1 = max(0, center_y - radius), min(height, center_y + radius + 1)
+            x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+            dy = ys[y0:y1, None] - center_y
+            dx = xs[None, x0:x1] - center_x
+            mask = dx * dx + dy * dy <= radius ** 2
+            image[y0:y1, x0:x1][mask] = color
             
         elif shape == 'rectangle':
-            x1 = np.random.randint(0, width - 50)
-            y1 = np.random.randint(0, height - 50)
-            w = np.random.randint(30, 100)
-            h = np.random.randint(30, 100)
-            x2 = min(x1 + w, width)
-            y2 = min(y1 + h, height)
+            x1, y1 = rect_xs[i], rect_ys[i]
+            x2 = min(x1 + rect_ws[i], width)
+            y2 = min(y1 + rect_hs[i], height)
             
             image[y1:y2, x1:x2] = color
     
-    # Add some gradient overlay
-    for y in range(height):
-        alpha = 0.3 * np.sin(y / height * np.pi)
-        image[y, :] = image[y, :] * (1 - alpha) + np.array([128, 128, 128]) * alpha
+    # Add some gradient overlay (per-row alpha broadcast over the image)
+    alpha = (0.3 * np.sin(np.arange(height) / height * np.pi)).astype(np.float32)[:, None, None]
+    blend = _image_buffer(scratch, height, width, dtype=np.float32)
+    np.multiply(image, 1 - alpha, out=blend)
+    blend += 128.0 * alpha
+    np.clip(blend, 0, 255, out=blend)
+    image[...] = blend
+    
+    return image
+
+def _init_worker():
+    """Give each worker process its own noise stream and reusable buffers"""
+    global _rng, _out_buf, _scratch_buf
+    _rng = np.random.default_rng()
+    _out_buf = np.empty((*_MAX_SIZE, 3), dtype=np.uint8)
+    _scratch_buf = np.empty((*_MAX_SIZE, 3), dtype=np.float32)
+
+def _make_one(filename: str, generator, samples_dir: str) -> str:
+    """Generate, finish and save a single sample image"""
+    filepath = os.path.join(samples_dir, filename)
+    
+    if os.path.exists(filepath):
+        return f"  {filename} already exists, skipping..."
+    
+    image = generator(out=_out_buf, scratch=_scratch_buf)
+    
+    # Add some final processing for realism
+    # Slight blur to make it look more natural
+    image = cv2.sepFilter2D(image, -1, _BLUR_KERNEL, _BLUR_KERNEL)
     
-    return image.astype(np.uint8)
+    # Save image
+    cv2.imwrite(filepath, image)
+    return f"  ✓ Saved {filepath} ({image.shape[1]}x{image.shape[0]})"
 
 def main():
     """Generate all sample images"""
@@ -219,23 +341,15 @@ def main():
     
     print("Generating sample images...")
     
-    for filename, generator in generators.items():
-        filepath = os.path.join(samples_dir, filename)
-        
-        if os.path.exists(filepath):
-            print(f"  {filename} already exists, skipping...")
-            continue
-        
-        print(f"  Creating {filename}...")
-        image = generator()
-        
-        # Add some final processing for realism
-        # Slight blur to make it look more natural
-        image = cv2.GaussianBlur(image, (3, 3), 0.5)
-        
-        # Save image
-        cv2.imwrite(filepath, image)
-        print(f"  ✓ Saved {filepath} ({image.shape[1]}x{image.shape[0]})")
+    # Each generator is independent, so build the images in parallel
+    max_workers = min(len(generators), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = [
+            executor.submit(_make_one, filename, generator, samples_dir)
+            for filename, generator in generators.items()
+        ]
+        for future in as_completed(futures):
+            print(future.result())
     
     print(f"\nSample generation complete!")
     print(f"Generated images are available in the '{samples_dir}' directory.")